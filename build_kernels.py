@@ -0,0 +1,37 @@
+"""
+AuraGrid Capstone: Ahead-of-time build of the weekly aggregation kernel
+
+Compiles the weekly aggregation kernel into a `grid_kernels` extension
+module next to grid_optimizer.py, so runs import it instead of paying
+Numba's JIT compile time. Rebuild after upgrading NumPy or Numba.
+
+Usage:
+    python build_kernels.py
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+
+cc = CC('grid_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('weekly_sums', 'Tuple((f8[:, :], i8[:, :]))(i8[:], i4[:], f4[:], i8, i8)')
+def weekly_sums(week_id, src_code, power, n_src, n_weeks):
+    """Scatter-add power into dense (n_src, n_weeks) sum and count matrices."""
+    sums = np.zeros((n_src, n_weeks))
+    counts = np.zeros((n_src, n_weeks), dtype=np.int64)
+
+    for i in range(power.size):
+        sums[src_code[i], week_id[i]] += power[i]
+        counts[src_code[i], week_id[i]] += 1
+
+    return sums, counts
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built grid_kernels in {cc.output_dir}")
@@ -7,11 +7,229 @@ Date: February 13, 2026
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import plotly.express as px
+import contextlib
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    from grid_kernels import weekly_sums as _aot_weekly_sum_kernel
+except ImportError:
+    _aot_weekly_sum_kernel = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# numba and datashader are only imported when a large input needs them;
+# checking for them here avoids paying their import time on every run
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+HAS_DATASHADER = importlib.util.find_spec('datashader') is not None
+
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+CSV_BLOCK_SIZE = 64 << 20
+
+CACHE_DIR = 'reports'
+CACHE_VERSION = 2
+CACHE_COUNTS_KEY = b'auragrid_ingest_counts'
+
+CSV_COLUMN_TYPES = {
+    'Time': pa.string(),
+    'Source_ID': pa.dictionary(pa.int32(), pa.string()),
+    'Power_Output': pa.float32(),
+    'Efficiency_Factor': pa.float32(),
+}
+
+CLEAN_SCHEMA = pa.schema([
+    ('Time', pa.timestamp('ns')),
+    ('Source_ID', pa.dictionary(pa.int32(), pa.string())),
+    ('Power_Output', pa.float32()),
+    ('Efficiency_Factor', pa.float32()),
+    ('Efficiency_Ratio', pa.float32()),
+    ('Week', pa.timestamp('ns')),
+])
+
+NS_PER_DAY = 86400 * 10**9
+NS_PER_WEEK = 7 * NS_PER_DAY
+
+# Weeks run Monday-Sunday and are labelled by their closing Sunday, the same
+# bins as resample('W'). The Unix epoch is a Thursday, so every label sits
+# three days past a multiple of NS_PER_WEEK.
+WEEK_LABEL_OFFSET = pa.scalar(6 * NS_PER_DAY, pa.duration('ns'))
+WEEK_SHIFT_NS = 3 * NS_PER_DAY
+
+# Below this many rows the JIT kernel's start-up outweighs its speed-up
+NUMBA_MIN_ROWS = 3_000_000
+
+# Upper bound on dense (source, week) cells the kernels may allocate
+DENSE_MAX_CELLS = 4_000_000
+
+DASHBOARD_POINTS_PER_SOURCE = 5000
+
+# Below this many rows a spawned report worker costs more than it overlaps
+PARALLEL_REPORT_MIN_ROWS = 250_000
+DASHBOARD_DENSITY_THRESHOLD = 200_000
+
+
+# Rebound to numba.prange when the kernel below is compiled
+prange = range
+_weekly_sum_kernel = None
+
+
+def _weekly_sum_loop(week_id, src_code, power, n_src, n_weeks, n_chunks):
+    """Scatter-add power into dense (n_src, n_weeks) sum and count matrices."""
+    chunk_size = (power.size + n_chunks - 1) // n_chunks
+    sums = np.zeros((n_chunks, n_src, n_weeks))
+    counts = np.zeros((n_chunks, n_src, n_weeks), dtype=np.int64)
+    
+    # Each thread accumulates into its own slice, so no two threads
+    # ever write to the same cell
+    for c in prange(n_chunks):
+        stop = min((c + 1) * chunk_size, power.size)
+        for i in range(c * chunk_size, stop):
+            sums[c, src_code[i], week_id[i]] += power[i]
+            counts[c, src_code[i], week_id[i]] += 1
+    
+    return sums.sum(axis=0), counts.sum(axis=0)
+
+
+def _load_weekly_sum_kernel():
+    """Import numba and compile (or load from its cache) the parallel kernel on first use."""
+    global _weekly_sum_kernel, prange
+    if _weekly_sum_kernel is None:
+        from numba import njit, prange
+        _weekly_sum_kernel = njit(parallel=True, cache=True, fastmath=True)(_weekly_sum_loop)
+    return _weekly_sum_kernel
+
+
+def _efficiency_ratio(power, factor):
+    """Return Power_Output / Efficiency_Factor with non-finite values masked, and their count."""
+    if ne is not None:
+        p = power.to_numpy(zero_copy_only=False)
+        e = factor.to_numpy(zero_copy_only=False)
+        ratio = ne.evaluate('p / e', local_dict={'p': p, 'e': e})
+        
+        # One mask catches zero and missing factors and any overflow, and
+        # serves both the count and the masking
+        invalid = ~np.isfinite(ratio)
+        invalid_count = int(np.count_nonzero(invalid))
+        if invalid_count:
+            ratio[invalid] = np.nan
+        return pa.array(ratio), invalid_count
+    
+    ratio = pc.divide(power, factor)
+    finite = pc.is_finite(ratio)
+    return pc.if_else(finite, ratio, pa.scalar(None, ratio.type)), len(ratio) - finite.true_count
+
+
+def _top_n_indices(values, n):
+    """Return indices of the n largest values, largest first."""
+    n = min(n, len(values))
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # O(N) partial selection; only the n winners are sorted
+    top = np.argpartition(values, -n)[-n:]
+    return top[np.argsort(-values[top], kind='stable')]
+
+
+def _axis_range(values):
+    """Return (min, max) of values for a raster axis, or None if it has no finite extent."""
+    low, high = float(values.min()), float(values.max())
+    if not (np.isfinite(low) and np.isfinite(high)):
+        return None
+    
+    # A constant column would give the canvas a zero-width axis
+    if low == high:
+        return low - 0.5, high + 0.5
+    return low, high
+
+
+def _weekly_sums_reduceat(src_codes, week_rel, power):
+    """Sum power per (source, week) run after one sort on a composite key."""
+    # One composite int64 key per row; a single sort makes every
+    # (source, week) pair a contiguous run that reduceat can sum
+    key = (src_codes.astype(np.int64) << 32) | week_rel
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+    starts = np.flatnonzero(np.diff(sorted_key)) + 1
+    starts = np.concatenate(([0], starts)) if sorted_key.size else starts
+    
+    sums = np.add.reduceat(power[order], starts, dtype=np.float64) if starts.size else np.empty(0)
+    run_keys = sorted_key[starts]
+    return (run_keys >> 32).astype(np.intp), run_keys & 0xFFFFFFFF, sums
+
+
+def _weekly_sums_numba(src_codes, week_rel, power, n_src, n_weeks, n_chunks):
+    """Sum power per (source, week) with the parallel Numba kernel."""
+    sums, counts = _load_weekly_sum_kernel()(
+        np.ascontiguousarray(week_rel),
+        np.ascontiguousarray(src_codes, dtype=np.int32),
+        np.ascontiguousarray(power),
+        n_src,
+        n_weeks,
+        n_chunks
+    )
+    run_src, run_week = np.nonzero(counts)
+    return run_src, run_week, sums[run_src, run_week]
+
+
+def _weekly_sums_aot(src_codes, week_rel, power, n_src, n_weeks):
+    """Sum power per (source, week) with the kernel built by build_kernels.py."""
+    sums, counts = _aot_weekly_sum_kernel(
+        np.ascontiguousarray(week_rel, dtype=np.int64),
+        np.ascontiguousarray(src_codes, dtype=np.int32),
+        np.ascontiguousarray(power, dtype=np.float32),
+        n_src,
+        n_weeks
+    )
+    run_src, run_week = np.nonzero(counts)
+    return run_src, run_week, sums[run_src, run_week]
+
+
+def _weekly_sums(src_codes, week_rel, power):
+    """
+    Sum power per (source, week), picking the fastest safe implementation.
+    Codes and week ids must be non-negative. The dense kernels are used only
+    while their matrices stay under DENSE_MAX_CELLS, so an outlier timestamp
+    falls back to reduceat instead of allocating a huge matrix.
+    """
+    if not power.size:
+        return _weekly_sums_reduceat(src_codes, week_rel, power)
+    
+    n_src = int(src_codes.max()) + 1
+    n_weeks = int(week_rel.max()) + 1
+    cells = n_src * n_weeks
+    
+    # The precompiled kernel has no start-up cost, so it wins at any size
+    if _aot_weekly_sum_kernel is not None and cells <= DENSE_MAX_CELLS:
+        return _weekly_sums_aot(src_codes, week_rel, power, n_src, n_weeks)
+    
+    if HAS_NUMBA and power.size >= NUMBA_MIN_ROWS:
+        from numba import get_num_threads
+        n_chunks = get_num_threads()
+        if cells * n_chunks <= DENSE_MAX_CELLS:
+            return _weekly_sums_numba(src_codes, week_rel, power, n_src, n_weeks, n_chunks)
+    
+    return _weekly_sums_reduceat(src_codes, week_rel, power)
+
 
 class GridDataProcessor:
     """
@@ -25,26 +243,138 @@ class GridDataProcessor:
         self.dataframe = None
         self.weekly_data = None
         self.top5_sources = []
+        self.ingest_counts = {}
+        self._stats_cache = {}
+        self.cache_path = None
+        self.loaded_from_cache = False
         print("Grid Data Processor Initialized")
         print("Target file:", filepath)
     
+    def _stat(self, key, compute):
+        """Return a cached reduction over the current dataframe, computing it once."""
+        if key not in self._stats_cache:
+            self._stats_cache[key] = compute()
+        return self._stats_cache[key]
+    
+    def _cache_prefix(self):
+        """Return the cache filename prefix shared by every version of this input."""
+        # A short hash of the absolute path keeps same-named inputs in
+        # different directories from sharing (and deleting) a cache
+        name = os.path.splitext(os.path.basename(self.filepath))[0]
+        path_hash = hashlib.sha1(os.path.abspath(self.filepath).encode()).hexdigest()[:12]
+        return os.path.join(CACHE_DIR, f".cache_v{CACHE_VERSION}_{name}_{path_hash}_")
+    
+    def _load_cache(self):
+        """Load the processed frame cached for the current input, if present."""
+        try:
+            table = pq.read_table(self.cache_path)
+            counts = json.loads(table.schema.metadata[CACHE_COUNTS_KEY])
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            return False
+        
+        self.dataframe = table.to_pandas(self_destruct=True)
+        self.ingest_counts = counts
+        self._stats_cache.clear()
+        self.loaded_from_cache = True
+        return True
+    
+    def _write_cache(self):
+        """Persist the processed frame as Parquet and remove stale caches of this input."""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            table = pa.Table.from_pandas(self.dataframe, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[CACHE_COUNTS_KEY] = json.dumps(self.ingest_counts)
+            pq.write_table(table.replace_schema_metadata(metadata), self.cache_path)
+            
+            for stale_path in glob.glob(glob.escape(self._cache_prefix()) + '*.parquet'):
+                if stale_path != self.cache_path:
+                    os.remove(stale_path)
+        except (OSError, pa.ArrowException) as e:
+            print(f"Warning: could not write cache {self.cache_path}: {e}")
+            return
+        
+        print(f"Processed data cached to: {self.cache_path}")
+    
+    def _iter_clean_batches(self):
+        """
+        Stream the CSV as Arrow record batches, cleaning and transforming each one.
+        Rows with invalid timestamps or null Power_Output are dropped per batch,
+        so the full raw file is never held in memory.
+        """
+        reader = pv.open_csv(
+            self.filepath,
+            read_options=pv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+            convert_options=pv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+        )
+        
+        required_columns = ['Time', 'Source_ID', 'Power_Output', 'Efficiency_Factor']
+        missing_columns = [col for col in required_columns if col not in reader.schema.names]
+        
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        counts = {'rows_read': 0, 'invalid_dates': 0, 'null_power': 0, 'invalid_ratios': 0}
+        self.ingest_counts = counts
+        
+        for batch in reader:
+            counts['rows_read'] += batch.num_rows
+            
+            # Malformed timestamps become nulls instead of failing the read
+            time = pc.strptime(batch['Time'], format=TIME_FORMAT, unit='ns', error_is_null=True)
+            valid_time = pc.is_valid(time)
+            valid_power = pc.is_valid(batch['Power_Output'])
+            keep = pc.and_(valid_time, valid_power)
+            
+            counts['invalid_dates'] += batch.num_rows - valid_time.true_count
+            counts['null_power'] += valid_time.true_count - keep.true_count
+            
+            time = time.filter(keep)
+            power = batch['Power_Output'].filter(keep)
+            factor = batch['Efficiency_Factor'].filter(keep)
+            
+            ratio, invalid_count = _efficiency_ratio(power, factor)
+            counts['invalid_ratios'] += invalid_count
+            
+            week_start = pc.floor_temporal(time, unit='week', week_starts_monday=True)
+            week = pc.add(week_start, WEEK_LABEL_OFFSET)
+            
+            yield pa.RecordBatch.from_arrays(
+                [time, batch['Source_ID'].filter(keep), power, factor, ratio, week],
+                schema=CLEAN_SCHEMA
+            )
+    
     def read_data(self):
-        """Read sensor data from CSV file with exception handling."""
+        """Read sensor data from CSV file in streamed batches with exception handling."""
         print("\nSTEP 1: Reading data from file")
         
         try:
-            self.dataframe = pd.read_csv(self.filepath)
-            
-            required_columns = ['Time', 'Source_ID', 'Power_Output', 'Efficiency_Factor']
-            missing_columns = [col for col in required_columns if col not in self.dataframe.columns]
+            # Keyed by mtime and size, so editing the CSV invalidates the cache
+            file_stat = os.stat(self.filepath)
+            self.cache_path = f"{self._cache_prefix()}{file_stat.st_mtime_ns}_{file_stat.st_size}.parquet"
+            self.loaded_from_cache = False
             
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            if self._load_cache():
+                print(f"Loaded processed data from cache: {self.cache_path}")
+            else:
+                batches = list(self._iter_clean_batches())
+                table = pa.Table.from_batches(batches, schema=CLEAN_SCHEMA)
+                del batches
+                
+                self.dataframe = table.to_pandas(self_destruct=True)
+                self._stats_cache.clear()
+                del table
+                
+                # Low-cardinality IDs stay categorical so groupbys and filters
+                # compare integer codes; IDs seen only in dropped rows are removed
+                source_ids = self.dataframe['Source_ID'].astype('category')
+                self.dataframe['Source_ID'] = source_ids.cat.remove_unused_categories()
             
-            print(f"Loaded {len(self.dataframe):,} records")
+            print(f"Loaded {self.ingest_counts['rows_read']:,} records")
             print(f"Columns: {list(self.dataframe.columns)}")
-            print(f"Date range: {self.dataframe['Time'].min()} to {self.dataframe['Time'].max()}")
-            print(f"Unique sources: {self.dataframe['Source_ID'].nunique()}")
+            print(f"Date range: {self._stat('time_min', self.dataframe['Time'].min)} "
+                  f"to {self._stat('time_max', self.dataframe['Time'].max)}")
+            print(f"Unique sources: {self._stat('n_sources', self.dataframe['Source_ID'].nunique)}")
             
             return self.dataframe
             
@@ -53,11 +383,11 @@ class GridDataProcessor:
             print("Please check the file path and try again.")
             raise FileNotFoundError(f"Sensor data file not found: {self.filepath}")
             
-        except pd.errors.EmptyDataError:
-            print(f"ERROR: File is empty - {self.filepath}")
-            raise IOError(f"The file {self.filepath} contains no data")
+        except pa.ArrowInvalid as e:
+            if os.path.getsize(self.filepath) == 0:
+                print(f"ERROR: File is empty - {self.filepath}")
+                raise IOError(f"The file {self.filepath} contains no data")
             
-        except pd.errors.ParserError as e:
             print(f"ERROR: Failed to parse CSV file")
             print(f"Details: {e}")
             raise IOError(f"Corrupted or invalid CSV format in {self.filepath}")
@@ -67,29 +397,23 @@ class GridDataProcessor:
             raise IOError(f"Failed to read {self.filepath}: {e}")
     
     def clean_data(self):
-        """Clean data by converting datetime and removing null values."""
+        """Report rows dropped for invalid timestamps or null power values during ingest."""
         print("\nSTEP 2: Cleaning data")
         
         if self.dataframe is None:
             raise ValueError("No data loaded. Call read_data() first.")
         
-        original_count = len(self.dataframe)
-        
-        print("Converting Time column to datetime...")
-        self.dataframe['Time'] = pd.to_datetime(self.dataframe['Time'], errors='coerce')
+        original_count = self.ingest_counts['rows_read']
         
-        invalid_dates = self.dataframe['Time'].isna().sum()
+        invalid_dates = self.ingest_counts['invalid_dates']
         if invalid_dates > 0:
             print(f"Warning: {invalid_dates} invalid dates found and removed")
-            self.dataframe = self.dataframe.dropna(subset=['Time'])
         
         print("Removing rows with null Power_Output values...")
-        null_power_before = self.dataframe['Power_Output'].isna().sum()
-        self.dataframe = self.dataframe.dropna(subset=['Power_Output'])
-        self.dataframe = self.dataframe.reset_index(drop=True)
+        null_power_before = self.ingest_counts['null_power']
         
         rows_removed = original_count - len(self.dataframe)
-        retention_rate = (len(self.dataframe) / original_count) * 100
+        retention_rate = (len(self.dataframe) / original_count) * 100 if original_count else 0.0
         
         print(f"Cleaning complete:")
         print(f"  Original records: {original_count:,}")
@@ -100,7 +424,7 @@ class GridDataProcessor:
         return self.dataframe
     
     def transform_data(self):
-        """Calculate efficiency ratio using vectorized operations."""
+        """Report the efficiency ratio and week key computed per batch during ingest."""
         print("\nSTEP 3: Transforming data")
         
         if self.dataframe is None:
@@ -108,24 +432,21 @@ class GridDataProcessor:
         
         print("Calculating Efficiency_Ratio = Power_Output / Efficiency_Factor...")
         
-        self.dataframe['Efficiency_Ratio'] = (
-            self.dataframe['Power_Output'] / 
-            self.dataframe['Efficiency_Factor']
-        )
-        
-        infinite_count = np.isinf(self.dataframe['Efficiency_Ratio']).sum()
-        if infinite_count > 0:
-            print(f"Warning: {infinite_count} infinite values detected")
-            self.dataframe['Efficiency_Ratio'].replace([np.inf, -np.inf], np.nan, inplace=True)
+        invalid_count = self.ingest_counts['invalid_ratios']
+        if invalid_count > 0:
+            print(f"Warning: {invalid_count} infinite or undefined values detected")
         
-        valid_ratios = self.dataframe['Efficiency_Ratio'].notna().sum()
-        avg_ratio = self.dataframe['Efficiency_Ratio'].mean()
+        valid_ratios = len(self.dataframe) - invalid_count
+        avg_ratio = self._stat('ratio_mean', self.dataframe['Efficiency_Ratio'].mean)
         
         print(f"Transformation complete:")
         print(f"  Valid Efficiency_Ratio values: {valid_ratios:,}")
         print(f"  Average Efficiency_Ratio: {avg_ratio:.2f}")
-        print(f"  Min: {self.dataframe['Efficiency_Ratio'].min():.2f}")
-        print(f"  Max: {self.dataframe['Efficiency_Ratio'].max():.2f}")
+        print(f"  Min: {self._stat('ratio_min', self.dataframe['Efficiency_Ratio'].min):.2f}")
+        print(f"  Max: {self._stat('ratio_max', self.dataframe['Efficiency_Ratio'].max):.2f}")
+        
+        if not self.loaded_from_cache:
+            self._write_cache()
         
         return self.dataframe
     
@@ -136,23 +457,39 @@ class GridDataProcessor:
         if self.dataframe is None:
             raise ValueError("No data loaded. Complete previous steps first.")
         
-        df_agg = self.dataframe.copy()
-        df_agg = df_agg.sort_values('Time')
+        print("Grouping by Source_ID and week...")
+        src_codes = self.dataframe['Source_ID'].cat.codes.to_numpy()
+        sources = self.dataframe['Source_ID'].cat.categories
+        week_ns = self.dataframe['Week'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        power = self.dataframe['Power_Output'].to_numpy()
+        
+        # Rows without a Source_ID (code -1) are left out of the weekly
+        # totals, as groupby would drop them
+        has_source = src_codes >= 0
+        if not has_source.all():
+            src_codes, week_ns, power = src_codes[has_source], week_ns[has_source], power[has_source]
         
-        print("Grouping by Source_ID and resampling to weekly...")
-        df_agg.set_index('Time', inplace=True)
+        week_id = (week_ns - WEEK_SHIFT_NS) // NS_PER_WEEK
+        week_min = week_id.min() if week_id.size else 0
         
-        weekly = df_agg.groupby('Source_ID').resample('W')['Power_Output'].sum()
-        self.weekly_data = weekly.reset_index()
+        run_src, run_week, sums = _weekly_sums(src_codes, week_id - week_min, power)
+        run_week = run_week + week_min
+        
+        self.weekly_data = pd.DataFrame({
+            'Source_ID': pd.Categorical.from_codes(run_src, categories=sources),
+            'Time': pd.to_datetime(run_week * NS_PER_WEEK + WEEK_SHIFT_NS, unit='ns'),
+            'Power_Output': sums,
+        })
         
         print("Identifying top 5 sources...")
-        total_by_source = self.weekly_data.groupby('Source_ID')['Power_Output'].sum()
-        total_by_source = total_by_source.sort_values(ascending=False)
-        self.top5_sources = total_by_source.head(5).index.tolist()
+        totals = np.bincount(run_src, weights=sums, minlength=len(sources))
+        total_by_source = pd.Series(totals, index=sources)
+        
+        self.top5_sources = sources[_top_n_indices(totals, 5)].tolist()
         
         total_weeks = self.weekly_data['Time'].nunique()
-        total_sources = self.weekly_data['Source_ID'].nunique()
-        overall_weekly_total = self.weekly_data['Power_Output'].sum()
+        total_sources = self._stat('n_sources', self.dataframe['Source_ID'].nunique)
+        overall_weekly_total = sums.sum()
         
         print(f"Aggregation complete:")
         print(f"  Total weeks: {total_weeks}")
@@ -172,18 +509,82 @@ class GridDataProcessor:
         
         stats = {
             'total_records': len(self.dataframe),
-            'unique_sources': self.dataframe['Source_ID'].nunique(),
-            'date_range_start': self.dataframe['Time'].min(),
-            'date_range_end': self.dataframe['Time'].max(),
-            'total_power_output': self.dataframe['Power_Output'].sum(),
-            'avg_power_output': self.dataframe['Power_Output'].mean(),
-            'avg_efficiency_factor': self.dataframe['Efficiency_Factor'].mean(),
-            'avg_efficiency_ratio': self.dataframe['Efficiency_Ratio'].mean(),
+            'unique_sources': self._stat('n_sources', self.dataframe['Source_ID'].nunique),
+            'date_range_start': self._stat('time_min', self.dataframe['Time'].min),
+            'date_range_end': self._stat('time_max', self.dataframe['Time'].max),
+            'total_power_output': self._stat(
+                'power_total', lambda: self.dataframe['Power_Output'].to_numpy().sum(dtype=np.float64)
+            ),
+            'avg_power_output': self._stat('power_mean', self.dataframe['Power_Output'].mean),
+            'avg_efficiency_factor': self._stat('factor_mean', self.dataframe['Efficiency_Factor'].mean),
+            'avg_efficiency_ratio': self._stat('ratio_mean', self.dataframe['Efficiency_Ratio'].mean),
         }
         
         return stats
 
 
+def _render_weekly_trend(weekly_data, top5_sources):
+    """Generate static line plot showing weekly power output trends."""
+    print("\nSTEP 5: Creating Matplotlib visualization")
+    
+    plt.figure(figsize=(14, 7), constrained_layout=True)
+    
+    colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E']
+    
+    print("Plotting top 5 sources...")
+    top5_data = weekly_data[weekly_data['Source_ID'].isin(top5_sources)]
+    groups = dict(iter(top5_data.sort_values('Time').groupby('Source_ID', observed=True)))
+    
+    for idx, source in enumerate(top5_sources):
+        source_data = groups[source]
+        
+        plt.plot(
+            source_data['Time'], 
+            source_data['Power_Output'],
+            marker='o', 
+            label=source,
+            linewidth=2.5,
+            markersize=6,
+            color=colors[idx % len(colors)],
+            alpha=0.8
+        )
+        
+        print(f"  Plotted {source}: {len(source_data)} weeks")
+    
+    plt.xlabel('Week', fontsize=13, fontweight='bold')
+    plt.ylabel('Total Power Output (kWh)', fontsize=13, fontweight='bold')
+    plt.title('Weekly Power Output Trends - Top 5 Renewable Sources', 
+              fontsize=15, fontweight='bold', pad=20)
+    
+    plt.legend(
+        loc='upper left', 
+        fontsize=11,
+        frameon=True,
+        shadow=True,
+        title='Source ID',
+        title_fontsize=12
+    )
+    
+    plt.grid(True, alpha=0.3, linestyle='--', linewidth=0.7)
+    plt.xticks(rotation=45, ha='right')
+    
+    output_path = 'reports/weekly_output_trend.png'
+    plt.savefig(output_path, dpi=150)
+    plt.close()
+    
+    print(f"\nStatic report saved to: {output_path}")
+    
+    return output_path
+
+
+def _render_weekly_trend_captured(weekly_data, top5_sources):
+    """Render the weekly trend report, returning its path and the printed log."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        output_path = _render_weekly_trend(weekly_data, top5_sources)
+    return output_path, log.getvalue()
+
+
 class ReportGenerator:
     """
     Class to generate visual reports for grid performance.
@@ -205,62 +606,67 @@ class ReportGenerator:
     
     def generate_matplotlib_report(self):
         """Generate static line plot showing weekly power output trends."""
-        print("\nSTEP 5: Creating Matplotlib visualization")
-        
-        plt.figure(figsize=(14, 7))
-        
-        colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E']
-        
-        print("Plotting top 5 sources...")
-        for idx, source in enumerate(self.top5_sources):
-            source_data = self.weekly_data[
-                self.weekly_data['Source_ID'] == source
-            ].sort_values('Time')
-            
-            plt.plot(
-                source_data['Time'], 
-                source_data['Power_Output'],
-                marker='o', 
-                label=source,
-                linewidth=2.5,
-                markersize=6,
-                color=colors[idx % len(colors)],
-                alpha=0.8
-            )
-            
-            print(f"  Plotted {source}: {len(source_data)} weeks")
-        
-        plt.xlabel('Week', fontsize=13, fontweight='bold')
-        plt.ylabel('Total Power Output (kWh)', fontsize=13, fontweight='bold')
-        plt.title('Weekly Power Output Trends - Top 5 Renewable Sources', 
-                  fontsize=15, fontweight='bold', pad=20)
-        
-        plt.legend(
-            loc='upper left', 
-            fontsize=11,
-            frameon=True,
-            shadow=True,
-            title='Source ID',
-            title_fontsize=12
-        )
+        return _render_weekly_trend(self.weekly_data, self.top5_sources)
+    
+    def _sample_per_source(self, max_points):
+        """Randomly keep at most max_points rows per Source_ID for plotting."""
+        source_codes = self.dataframe['Source_ID'].cat.codes.to_numpy()
         
-        plt.grid(True, alpha=0.3, linestyle='--', linewidth=0.7)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        # Codes are shifted by one so rows without a Source_ID (-1) count too
+        if len(source_codes) == 0 or np.bincount(source_codes + 1).max() <= max_points:
+            return self.dataframe
         
-        output_path = 'reports/weekly_output_trend.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # Rank rows within each source in a random order and keep the first
+        # max_points; only the sampled rows are copied out of the frame
+        order = np.random.default_rng(0).permutation(len(source_codes))
+        permuted_codes = pd.Series(source_codes[order])
+        keep = permuted_codes.groupby(permuted_codes).cumcount().to_numpy() < max_points
         
-        print(f"\nStatic report saved to: {output_path}")
+        plot_data = self.dataframe.iloc[np.sort(order[keep])]
+        print(f"Sampled {len(plot_data):,} of {len(self.dataframe):,} points "
+              f"(at most {max_points:,} per source)")
         
-        return output_path
+        return plot_data
+    
+    def _add_density_layer(self, fig):
+        """Rasterize every point with datashader and place it behind the sampled scatter."""
+        x_range = _axis_range(self.dataframe['Efficiency_Factor'])
+        y_range = _axis_range(self.dataframe['Power_Output'])
+        if x_range is None or y_range is None:
+            print("Skipping density layer: no finite range to rasterize")
+            return
+        
+        import datashader as ds
+        import datashader.transfer_functions as tf
+        
+        print("Rendering density layer for all points...")
+        
+        canvas = ds.Canvas(plot_width=800, plot_height=600, x_range=x_range, y_range=y_range)
+        agg = canvas.points(self.dataframe, 'Efficiency_Factor', 'Power_Output', ds.count_cat('Source_ID'))
+        
+        # Reuse the scatter's per-source colors so the raster matches the legend
+        color_key = {
+            trace.name: tuple(int(c) for c in px.colors.unlabel_rgb(trace.marker.color))
+            for trace in fig.data
+        }
+        image = tf.shade(agg, color_key=color_key, how='eq_hist').to_pil()
+        
+        fig.add_layout_image(
+            source=image,
+            xref='x', yref='y',
+            x=x_range[0], y=y_range[1],
+            sizex=x_range[1] - x_range[0], sizey=y_range[1] - y_range[0],
+            sizing='stretch',
+            layer='below'
+        )
+        fig.update_xaxes(range=x_range)
+        fig.update_yaxes(range=y_range)
     
     def generate_plotly_dashboard(self):
         """Generate interactive scatter plot for efficiency analysis."""
         print("\nSTEP 6: Creating Plotly dashboard")
         
-        plot_data = self.dataframe.reset_index(drop=True)
+        plot_data = self._sample_per_source(DASHBOARD_POINTS_PER_SOURCE)
         
         print("Creating interactive scatter plot...")
         
@@ -282,7 +688,8 @@ class ReportGenerator:
                 'Power_Output': 'Power Output (kWh)',
                 'Source_ID': 'Source ID'
             },
-            color_discrete_sequence=px.colors.qualitative.Bold
+            color_discrete_sequence=px.colors.qualitative.Bold,
+            render_mode='webgl'
         )
         
         fig.update_layout(
@@ -320,9 +727,13 @@ class ReportGenerator:
             marker=dict(size=6, opacity=0.7, line=dict(width=0.5, color='white'))
         )
         
+        if HAS_DATASHADER and len(self.dataframe) > DASHBOARD_DENSITY_THRESHOLD:
+            self._add_density_layer(fig)
+        
         output_path = 'reports/efficiency_dashboard.html'
         fig.write_html(
             output_path,
+            include_plotlyjs='cdn',
             config={
                 'displayModeBar': True,
                 'displaylogo': False,
@@ -336,6 +747,13 @@ class ReportGenerator:
         return output_path
 
 
+def _available_cpus():
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def main():
     """Main function to run the grid optimizer pipeline."""
     print("\nAuraGrid Capstone Project")
@@ -360,8 +778,22 @@ def main():
         print("\nPHASE 2: Generating Reports")
         
         reporter = ReportGenerator(processor.dataframe, weekly_data, top5_sources)
-        matplotlib_output = reporter.generate_matplotlib_report()
-        plotly_output = reporter.generate_plotly_dashboard()
+        
+        # The two reports are independent; on large inputs with a spare core,
+        # render the static report in a worker while this process builds the
+        # dashboard. The worker only gets the weekly data, not the full frame,
+        # and its log is printed once it finishes. It is spawned rather than
+        # forked: forking after Arrow, Numba and numexpr have started their
+        # thread pools can deadlock the child.
+        if _available_cpus() > 1 and len(reporter.dataframe) >= PARALLEL_REPORT_MIN_ROWS:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                matplotlib_future = executor.submit(_render_weekly_trend_captured, weekly_data, top5_sources)
+                plotly_output = reporter.generate_plotly_dashboard()
+                matplotlib_output, matplotlib_log = matplotlib_future.result()
+            print(matplotlib_log, end='')
+        else:
+            matplotlib_output = reporter.generate_matplotlib_report()
+            plotly_output = reporter.generate_plotly_dashboard()
         
         print("\nAll reports generated")
         